@@ -0,0 +1,171 @@
+# autoplayer.py - scripted player that drives the finger from the game state
+import math
+import random
+
+import config
+
+# screen px -> camera px at the speed reference width (4:3 camera)
+_CAM_SCALE_X = config.SPEED_REFERENCE_WIDTH / config.SCREEN_WIDTH
+_CAM_SCALE_Y = config.SPEED_REFERENCE_WIDTH * 3 / 4 / config.SCREEN_HEIGHT
+
+
+def finger_speed(dx, dy):
+    # per-frame screen movement -> the speed units handle_camera produces
+    return math.hypot(dx * _CAM_SCALE_X, dy * _CAM_SCALE_Y) * config.FPS / 30.0
+
+
+class AutoPlayer:
+    """Generates swipe paths for FruitNinjaGame without a camera.
+
+    Each frame update() picks a fruit, repositions the finger to a point behind
+    it, then swipes through it. Speeds are in finger_speed units as multiples
+    of config.SLICE_SPEED_THRESHOLD, whatever the direction. Repositioning may
+    be fast, but only when the next finger position is clear of every live
+    fruit and bomb; near one it drops below the threshold, like a player
+    lifting their finger around it. Weak swipes stay below the threshold.
+    """
+
+    def __init__(self, game, skill="average", seed=None):
+        self.game = game
+        self.skill_name = skill
+        self.skill = config.AUTOPLAYER_SKILLS[skill]
+        self.rng = random.Random(seed)
+
+        self.target = None
+        self.phase = "idle"  # idle, approach, swipe
+        self.wait_frames = 0
+        self.swipe_dir = (1.0, 0.0)
+        self.swipe_frames = 0
+        self.current_swipe_speed = 0.0
+        self.aim_offset = (0.0, 0.0)
+        self.x = float(game.finger_x)
+        self.y = float(game.finger_y)
+
+        threshold = config.SLICE_SPEED_THRESHOLD
+        self.move_speed = self.skill["move_factor"] * threshold
+        self.careful_speed = 0.8 * threshold
+        self.swipe_speed = self.skill["swipe_factor"] * threshold
+        # self-check for soak runs: fruits / bombs sliced while only repositioning
+        self.unintended_slices = 0
+        self._fast_approach = False
+        self._live = []
+
+    def _pick_target(self):
+        candidates = []
+        for fruit in self.game.fruits:
+            if fruit.is_sliced or fruit.y > config.SCREEN_HEIGHT - 40:
+                continue
+            if fruit.is_bomb and self.rng.random() >= self.skill["bomb_mistake"]:
+                continue
+            candidates.append(fruit)
+        if not candidates:
+            return None
+        # falling fruits (vy > 0) are about to be missed; go for them first
+        candidates.sort(key=lambda f: (f.vy <= 0, math.hypot(f.x - self.x, f.y - self.y)))
+        return candidates[0]
+
+    def _lead(self, fruit, ox, oy, speed):
+        # aim where the fruit will be when the finger gets there (two refinement passes)
+        t = 0.0
+        for _ in range(2):
+            px = fruit.x + fruit.vx * t + ox
+            py = fruit.y + fruit.vy * t + 0.5 * config.GRAVITY * t * t + oy
+            dx, dy = px - self.x, py - self.y
+            dist = math.hypot(dx, dy)
+            if dist == 0:
+                break
+            t = dist / (speed / finger_speed(dx / dist, dy / dist))
+        return px, py
+
+    def _clear_of_fruit(self, x, y):
+        # would the finger at (x, y) hit anything after this frame's fruit.update()?
+        radius = config.AUTOPLAYER_SAFE_RADIUS
+        for fruit in self.game.fruits:
+            if fruit.is_sliced:
+                continue
+            fx = fruit.x + fruit.vx
+            fy = fruit.y + fruit.vy + config.GRAVITY
+            if (fx - x) ** 2 + (fy - y) ** 2 < radius ** 2:
+                return False
+        return True
+
+    def _approach_speed(self, tx, ty):
+        # fast repositioning unless the landing point is near a live fruit or bomb
+        if self.move_speed <= self.careful_speed:
+            return self.move_speed
+        saved = self.x, self.y
+        self._move_towards(tx, ty, self.move_speed)
+        clear = self._clear_of_fruit(self.x, self.y)
+        self.x, self.y = saved
+        return self.move_speed if clear else self.careful_speed
+
+    def _move_towards(self, tx, ty, speed):
+        # move so the resulting finger_speed is `speed`, whatever the direction
+        dx, dy = tx - self.x, ty - self.y
+        dist = math.hypot(dx, dy)
+        if dist == 0:
+            return True
+        step = speed / finger_speed(dx / dist, dy / dist)
+        if dist <= step:
+            self.x, self.y = tx, ty
+            return True
+        self.x += dx / dist * step
+        self.y += dy / dist * step
+        return False
+
+    def update(self):
+        s = self.skill
+        prev_x, prev_y = self.x, self.y
+        approaching = False
+
+        # anything live last frame that got sliced during a fast approach was an accident
+        if self._fast_approach:
+            self.unintended_slices += sum(1 for fruit in self._live if fruit.is_sliced)
+
+        if self.target is not None and (self.target.is_sliced or self.target not in self.game.fruits):
+            self.target, self.phase = None, "idle"
+
+        if self.phase == "idle":
+            if self.wait_frames > 0:
+                self.wait_frames -= 1
+            else:
+                self.target = self._pick_target()
+                if self.target is not None:
+                    angle = self.rng.uniform(0, 2 * math.pi)
+                    self.swipe_dir = (math.cos(angle), math.sin(angle))
+                    self.aim_offset = (self.rng.gauss(0, s["aim_error"]), self.rng.gauss(0, s["aim_error"]))
+                    self.phase = "approach"
+
+        if self.phase == "approach":
+            approaching = True
+            half = s["swipe_length"] / 2
+            tx, ty = self._lead(self.target, self.aim_offset[0] - self.swipe_dir[0] * half,
+                                self.aim_offset[1] - self.swipe_dir[1] * half, self.move_speed)
+            if self._move_towards(tx, ty, self._approach_speed(tx, ty)):
+                self.phase = "swipe"
+                self.swipe_frames = 0
+                # sometimes a swipe is too lazy to register as a slice
+                self.current_swipe_speed = self.swipe_speed
+                if self.rng.random() < s["weak_swipe"]:
+                    self.current_swipe_speed = self.careful_speed
+
+        elif self.phase == "swipe":
+            half = s["swipe_length"] / 2
+            tx, ty = self._lead(self.target, self.aim_offset[0] + self.swipe_dir[0] * half,
+                                self.aim_offset[1] + self.swipe_dir[1] * half, self.current_swipe_speed)
+            self.swipe_frames += 1
+            if self._move_towards(tx, ty, self.current_swipe_speed) or self.swipe_frames > 30:
+                self.target, self.phase = None, "idle"
+                self.wait_frames = s["reaction_frames"]
+
+        self.x = min(max(self.x, 0), config.SCREEN_WIDTH - 1)
+        self.y = min(max(self.y, 0), config.SCREEN_HEIGHT - 1)
+
+        speed = finger_speed(self.x - prev_x, self.y - prev_y)
+        self._fast_approach = approaching and speed > config.SLICE_SPEED_THRESHOLD
+        self._live = [fruit for fruit in self.game.fruits if not fruit.is_sliced] if self._fast_approach else []
+
+        self.game.finger_x = int(self.x)
+        self.game.finger_y = int(self.y)
+        self.game.finger_speed = speed
+        self.game.trail.add_point(self.game.finger_x, self.game.finger_y)
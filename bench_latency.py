@@ -0,0 +1,94 @@
+# bench_latency.py - per-frame latency from capture through inference to trail point
+#
+# Runs the same steps as FruitNinjaGame.handle_camera on a camera, a video file
+# or a synthetic source, timestamping each stage, and reports percentiles.
+#
+#   python bench_latency.py --source synthetic --frames 600 --realtime
+#   python bench_latency.py --source clip.mp4
+#   python bench_latency.py --source 0 --no-drain
+import argparse
+import time
+
+import cv2
+
+import config
+from capture import open_source
+from game_objects import Trail
+from hand_detector import HandDetector
+from perf_stats import percentile
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def run(source, frames):
+    detector = HandDetector(max_hands=1, detection_con=0.7, smooth=True)
+    trail = Trail()
+    stages = {"capture->inference": [], "inference->trail": [], "capture->trail": [], "frame interval": []}
+    detected = 0
+    prev_capture = None
+    last_point = (config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2)
+
+    count = 0
+    while count < frames:
+        ok, img, t_capture = source.read()
+        if not ok:
+            break
+        count += 1
+
+        img = cv2.flip(img, 1)
+        img = detector.find_hands(img, draw=True)
+        t_inference = time.perf_counter()
+        detector.find_position(img, draw=False)
+        sx, sy, _ = detector.get_index_finger_position()
+
+        stages["capture->inference"].append((t_inference - t_capture) * 1000.0)
+        if prev_capture is not None:
+            stages["frame interval"].append((t_capture - prev_capture) * 1000.0)
+        prev_capture = t_capture
+
+        # without a hand (e.g. the synthetic source) the trail step still runs
+        # at the last known point, so capture->trail is measured without a camera
+        if sx is not None:
+            cam_h, cam_w = img.shape[:2]
+            last_point = (int(sx * config.SCREEN_WIDTH / cam_w), int(sy * config.SCREEN_HEIGHT / cam_h))
+            detected += 1
+        trail.add_point(*last_point)
+        t_trail = time.perf_counter()
+        stages["inference->trail"].append((t_trail - t_inference) * 1000.0)
+        stages["capture->trail"].append((t_trail - t_capture) * 1000.0)
+
+    return count, detected, stages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Capture-to-trail latency harness")
+    parser.add_argument("--source", default="synthetic", help='"synthetic", a camera index or a video file')
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--no-drain", action="store_true", help="process buffered frames instead of the newest")
+    parser.add_argument("--realtime", action="store_true",
+                        help="pace the synthetic source at config.CAMERA_FPS (otherwise frame interval is generation speed)")
+    args = parser.parse_args(argv)
+
+    source = open_source(args.source, frames=args.frames, drain=not args.no_drain, realtime=args.realtime)
+    try:
+        count, detected, stages = run(source, args.frames)
+    finally:
+        source.release()
+
+    width, height = source.size
+    print(f"source={args.source} size={width}x{height} frames={count} with_hand={detected} "
+          f"dropped_stale={source.dropped}")
+    header = "".join(f"{'p' + str(p):>9}" for p in PERCENTILES)
+    print(f"{'stage (ms)':<20}{header}{'max':>9}{'n':>7}")
+    for name, values in stages.items():
+        values = sorted(values)
+        if not values:
+            print(f"{name:<20}{'n/a':>9}")
+            continue
+        cols = "".join(f"{percentile(values, p):>9.2f}" for p in PERCENTILES)
+        print(f"{name:<20}{cols}{values[-1]:>9.2f}{len(values):>7}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,76 @@
+# bench_startup.py - measure time to first frame / first hand detection
+#
+# Launches `main.py --startup-bench` in a fresh process per run (so imports are
+# measured cold) and reports timings relative to process spawn.
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+METRICS = [
+    ("first_frame", "time to first frame"),
+    ("ready", "camera + model ready"),
+    ("first_inference", "time to first inference"),
+    ("first_detection", "time to first detection"),
+]
+
+
+def run_once(timeout, headless):
+    env = dict(os.environ)
+    if headless:
+        env.setdefault("SDL_VIDEODRIVER", "dummy")
+        env.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    spawn = time.time()
+    try:
+        proc = subprocess.run(
+            [sys.executable, "main.py", "--startup-bench"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            env=env, capture_output=True, text=True, timeout=timeout
+        )
+    except subprocess.TimeoutExpired:
+        return None
+    for line in proc.stdout.splitlines():
+        if line.startswith("STARTUP_BENCH "):
+            report = json.loads(line[len("STARTUP_BENCH "):])
+            times = report["times"]
+            return report["ok"], {k: (v - spawn) * 1000.0 for k, v in times.items()}
+    raise RuntimeError(f"no startup report (exit code {proc.returncode}):\n{proc.stderr[-2000:]}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Startup-time benchmark for main.py")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds per run")
+    parser.add_argument("--headless", action="store_true", help="use SDL dummy video/audio drivers")
+    args = parser.parse_args(argv)
+
+    results = {key: [] for key, _ in METRICS}
+    for i in range(args.runs):
+        result = run_once(args.timeout, args.headless)
+        if result is None:
+            print(f"run {i + 1}: timed out after {args.timeout:.0f}s")
+            continue
+        ok, times = result
+        line = "  ".join(f"{key}={times[key]:.0f}ms" for key, _ in METRICS if key in times)
+        print(f"run {i + 1}: {line}" + ("" if ok else "  (camera / model unavailable)"))
+        for key, _ in METRICS:
+            if key in times:
+                results[key].append(times[key])
+
+    print()
+    print(f"{'metric':<26} {'min':>8} {'median':>8} {'max':>8}")
+    for key, label in METRICS:
+        values = results[key]
+        if not values:
+            print(f"{label:<26} {'n/a':>8}")
+            continue
+        print(f"{label:<26} {min(values):>7.0f}ms {statistics.median(values):>7.0f}ms {max(values):>7.0f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
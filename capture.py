@@ -0,0 +1,141 @@
+# capture.py - low-latency camera setup and timestamped frame sources
+import time
+
+import cv2
+import numpy as np
+
+import config
+
+
+def open_camera(index=config.CAMERA_INDEX, size=config.CAMERA_SIZE, fps=config.CAMERA_FPS,
+                fourcc=config.CAMERA_FOURCC, buffer_size=config.CAMERA_BUFFER_SIZE):
+    cap = cv2.VideoCapture(index)
+    # VideoCapture does not raise for a missing device; fail loudly here instead
+    if not cap.isOpened():
+        cap.release()
+        raise RuntimeError(f"could not open camera {index}")
+    # FOURCC first: on V4L2 the format decides which sizes / rates are offered,
+    # and MJPEG usually allows higher fps than raw YUYV at the same resolution
+    if fourcc:
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+    # with size=None no mode is forced; FrameSource.size reports what the device chose
+    if size:
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, size[0])
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, size[1])
+    if fps:
+        cap.set(cv2.CAP_PROP_FPS, fps)
+    # backends without buffer control just ignore this; draining covers them
+    if buffer_size:
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, buffer_size)
+    return cap
+
+
+class FrameSource:
+    """Wraps a cv2.VideoCapture; read() returns (ok, frame, capture_time).
+
+    With drain=True, frames already sitting in the driver buffer are skipped:
+    a grab() that returns almost instantly came from the buffer, one that
+    blocks waited for the sensor, so we keep grabbing until a grab blocks (or
+    max_drain is hit) and only then decode with retrieve().
+
+    capture_time is when the frame was captured, not when grab() returned, so
+    time a frame spent in the driver buffer counts as latency. It comes from
+    the backend buffer timestamp (CAP_PROP_POS_MSEC, set by V4L2 / MSMF),
+    mapped onto perf_counter through the smallest (grab time - buffer time)
+    seen so far, i.e. relative to the freshest frame delivered. Backends
+    without buffer timestamps fall back to the grab() return time.
+    """
+
+    def __init__(self, cap, drain=config.CAMERA_DRAIN, max_drain=config.CAMERA_MAX_DRAIN,
+                 fresh_grab_ms=config.CAMERA_FRESH_GRAB_MS, buffer_timestamps=True):
+        self.cap = cap
+        self.drain = drain
+        self.max_drain = max_drain
+        self.fresh_grab_s = fresh_grab_ms / 1000.0
+        self.buffer_timestamps = buffer_timestamps
+        self.dropped = 0  # stale frames skipped by draining
+        self._clock_offset = None
+
+    @property
+    def size(self):
+        # resolution the driver actually negotiated
+        return int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+    def read(self):
+        if not self.drain:
+            ok = self.cap.grab()
+        else:
+            grabs = 0
+            while True:
+                start = time.perf_counter()
+                ok = self.cap.grab()
+                grabs += 1
+                if not ok or time.perf_counter() - start >= self.fresh_grab_s or grabs > self.max_drain:
+                    break
+            self.dropped += grabs - 1
+        capture_time = self._capture_time(time.perf_counter())
+        if not ok:
+            return False, None, capture_time
+        ok, frame = self.cap.retrieve()
+        return ok, frame, capture_time
+
+    def _capture_time(self, grabbed_at):
+        if not self.buffer_timestamps:
+            return grabbed_at
+        buffer_s = self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+        if buffer_s <= 0:
+            return grabbed_at
+        offset = grabbed_at - buffer_s
+        if self._clock_offset is None or offset < self._clock_offset:
+            self._clock_offset = offset
+        return buffer_s + self._clock_offset
+
+    def release(self):
+        self.cap.release()
+
+
+class SyntheticSource:
+    """Camera stand-in for benchmarks: a moving blob on a dark background."""
+
+    def __init__(self, size=config.CAMERA_SIZE, frames=600, fps=config.CAMERA_FPS, realtime=False):
+        self.size = tuple(size or (640, 480))
+        self.frames = frames
+        self.fps = fps or 30
+        self.realtime = realtime
+        self.dropped = 0
+        self._index = 0
+        self._next_time = None
+
+    def read(self):
+        if self._index >= self.frames:
+            return False, None, time.perf_counter()
+        if self.realtime:
+            now = time.perf_counter()
+            if self._next_time is None:
+                self._next_time = now
+            if self._next_time > now:
+                time.sleep(self._next_time - now)
+            self._next_time += 1.0 / self.fps
+
+        w, h = self.size
+        frame = np.full((h, w, 3), 30, dtype=np.uint8)
+        t = self._index / self.fps
+        cx = int(w / 2 + w / 3 * np.sin(t * 2.0))
+        cy = int(h / 2 + h / 4 * np.cos(t * 3.0))
+        cv2.circle(frame, (cx, cy), h // 8, (120, 160, 220), cv2.FILLED)
+        self._index += 1
+        return True, frame, time.perf_counter()
+
+    def release(self):
+        pass
+
+
+def open_source(spec, frames=600, drain=config.CAMERA_DRAIN, realtime=False):
+    # "synthetic", a camera index ("0") or a video file path
+    if spec == "synthetic":
+        return SyntheticSource(frames=frames, realtime=realtime)
+    if spec.isdigit():
+        return FrameSource(open_camera(int(spec)), drain=drain)
+    # files are decoded on demand: no buffer to drain, and POS_MSEC is the
+    # position in the video rather than a capture time
+    return FrameSource(cv2.VideoCapture(spec), drain=False, buffer_timestamps=False)
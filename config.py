@@ -66,3 +66,32 @@ SOUNDS = {
     "bomb": "bomb.wav",
     "music": "music.mp3"
 }
+
+# Score store / session telemetry
+SCORE_DB_PATH = "scores.db"
+STORE_BATCH_SIZE = 32             # rows per write transaction
+STORE_FLUSH_INTERVAL_S = 1.0      # writer thread wake-up interval
+FRAME_TIME_BUCKETS_MS = (8, 12, 17, 20, 25, 33, 50, 100)  # frame-time histogram edges
+
+# Camera capture (see capture.py)
+CAMERA_INDEX = 0
+CAMERA_SIZE = (640, 480)          # requested; None keeps the device's default (native) mode
+CAMERA_FPS = 60                   # requested capture rate (0 = driver default)
+CAMERA_FOURCC = "MJPG"            # "" keeps the driver default format
+CAMERA_BUFFER_SIZE = 1            # driver-side frame queue length (0 = driver default)
+CAMERA_DRAIN = True               # skip stale buffered frames, always process the newest
+CAMERA_MAX_DRAIN = 4              # max extra grabs per read while draining
+CAMERA_FRESH_GRAB_MS = 4.0        # a grab faster than this came from the buffer
+SPEED_REFERENCE_WIDTH = 640       # camera width SLICE_SPEED_THRESHOLD was tuned at
+
+# Autoplayer (see autoplayer.py). move/swipe factors are multiples of
+# SLICE_SPEED_THRESHOLD; fast moves are only made clear of live fruit.
+AUTOPLAYER_SAFE_RADIUS = 80       # > Fruit.check_collision threshold (55) plus a frame of motion
+AUTOPLAYER_SKILLS = {
+    "novice": {"reaction_frames": 24, "move_factor": 1.8, "swipe_factor": 1.6, "swipe_length": 160,
+               "aim_error": 34, "weak_swipe": 0.25, "bomb_mistake": 0.15},
+    "average": {"reaction_frames": 14, "move_factor": 2.0, "swipe_factor": 2.2, "swipe_length": 200,
+                "aim_error": 22, "weak_swipe": 0.1, "bomb_mistake": 0.05},
+    "expert": {"reaction_frames": 4, "move_factor": 3.5, "swipe_factor": 3.5, "swipe_length": 240,
+               "aim_error": 10, "weak_swipe": 0.02, "bomb_mistake": 0.0}
+}
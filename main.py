@@ -1,12 +1,14 @@
-import cv2
+import argparse
+import json
 import pygame
 import random
 import sys
 import math
 import os
 import time
-from hand_detector import HandDetector
+from startup import StartupLoader
 from game_objects import Fruit, Trail, Particle
+from score_store import ScoreStore, SessionTelemetry
 import config
 
 # Create assets folder if missing (no files required)
@@ -14,7 +16,15 @@ if not os.path.isdir(config.ASSETS_DIR):
     os.makedirs(config.ASSETS_DIR, exist_ok=True)
 
 class FruitNinjaGame:
-    def __init__(self):
+    def __init__(self, startup_bench=False, bench_hand_timeout=10.0, use_camera=True, store_path=config.SCORE_DB_PATH):
+        # camera + hand model load in the background while the menu is shown;
+        # use_camera=False is for scripted input (autoplayer / soak runs)
+        self.loader = None
+        if use_camera:
+            self.loader = StartupLoader(
+                detector_kwargs={"max_hands": 1, "detection_con": 0.7, "smooth": True}
+            ).start()
+
         pygame.init()
         pygame.mixer.init()
         self.screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
@@ -27,12 +37,19 @@ class FruitNinjaGame:
         self.font_small = pygame.font.Font(None, 32)
         self.font_mono = pygame.font.SysFont("consolas", 22)
 
+        # Persistent scores / telemetry (writes happen on a background thread)
+        self.store = ScoreStore(store_path)
+        self.telemetry = None
+
         # Game state
         self.score = 0
-        self.high_score = 0
         self.lives = config.INITIAL_LIVES
         self.state = "menu"  # menu, playing, paused, game_over
         self.difficulty = "Normal"
+        # pristine presets; slow_motion edits config.DIFFICULTY in place
+        self._base_difficulty = {name: d.copy() for name, d in config.DIFFICULTY.items()}
+        self.high_score = 0  # filled in by poll_store once the store has loaded
+        self._store_synced = False
 
         # Objects
         self.fruits = []
@@ -40,11 +57,16 @@ class FruitNinjaGame:
         self.particles = []
         self.frame_count = 0
 
-        # Hand / camera
-        self.cap = cv2.VideoCapture(0)
-        self.cap.set(3, 640)
-        self.cap.set(4, 480)
-        self.detector = HandDetector(max_hands=1, detection_con=0.7, smooth=True)
+        # Hand / camera (filled in by poll_loader once the loader finishes)
+        self.cv2 = None
+        self.camera = None
+        self.cam_surface = None
+        self.detector = None
+
+        # startup timings (absolute time.time())
+        self.startup_bench = startup_bench
+        self.bench_hand_timeout = bench_hand_timeout
+        self.startup_times = {}
 
         self.finger_x = config.SCREEN_WIDTH // 2
         self.finger_y = config.SCREEN_HEIGHT // 2
@@ -104,41 +126,73 @@ class FruitNinjaGame:
         fruit = Fruit(x, y, data, config.SCREEN_WIDTH, config.SCREEN_HEIGHT, size=config.FRUIT_SIZE)
         self.fruits.append(fruit)
 
+    def poll_loader(self):
+        # adopt the camera / detector once the background loader is finished
+        if self.loader is None or self.camera is not None or not self.loader.done:
+            return
+        self.startup_times.update(self.loader.timings)
+        if self.loader.ready:
+            self.cv2 = self.loader.cv2
+            self.camera = self.loader.camera
+            self.detector = self.loader.detector
+
+    def poll_store(self):
+        # pick up the saved high score once the store's writer thread has read it
+        if self._store_synced or not self.store.loaded.is_set():
+            return
+        self._store_synced = True
+        self.high_score = max(self.high_score, self.store.get_high_score(self.difficulty))
+
     def handle_camera(self):
-        success, img = self.cap.read()
+        if self.camera is None:
+            return
+        cv2 = self.cv2
+
+        # newest frame only (stale buffered frames are drained by FrameSource)
+        success, img, _ = self.camera.read()
         if not success:
             return
 
-        # Flip and process
+        # Flip and process at the negotiated camera resolution (no resize)
         img = cv2.flip(img, 1)
-        img = cv2.resize(img, (640, 480))
+        det_start = time.perf_counter()
         img = self.detector.find_hands(img, draw=True)
+        if self.telemetry is not None and self.state == "playing":
+            self.telemetry.record_detection((time.perf_counter() - det_start) * 1000.0)
+        if "first_inference" not in self.startup_times:
+            self.startup_times["first_inference"] = time.time()
+        if "first_detection" not in self.startup_times and self.detector.results.multi_hand_landmarks:
+            self.startup_times["first_detection"] = time.time()
         self.detector.find_position(img, draw=False)
 
         sx, sy, spd = self.detector.get_index_finger_position()
         if sx is not None:
-            cam_w, cam_h = 640, 480
+            cam_h, cam_w = img.shape[:2]
             self.finger_x = int(sx * config.SCREEN_WIDTH / cam_w)
             self.finger_y = int(sy * config.SCREEN_HEIGHT / cam_h)
-            self.finger_speed = spd / 30.0
+            # speed is in camera pixels; normalise to the width the threshold was tuned at
+            self.finger_speed = spd * config.SPEED_REFERENCE_WIDTH / cam_w / 30.0
             self.trail.add_point(self.finger_x, self.finger_y)
 
-        # Convert to pygame surface
+        # Convert to pygame surface; drawn later by draw_camera_preview
         preview_w, preview_h = config.CAM_PREVIEW_SIZE
-        x, y = config.CAM_PREVIEW_POS
-
         cam_small = cv2.resize(img, (preview_w, preview_h))
         cam_small = cv2.cvtColor(cam_small, cv2.COLOR_BGR2RGB)
         cam_small = cam_small.swapaxes(0, 1)
+        self.cam_surface = pygame.surfarray.make_surface(cam_small)
 
-        surf = pygame.surfarray.make_surface(cam_small)
+    def draw_camera_preview(self):
+        if self.cam_surface is None:
+            return
+        preview_w, preview_h = config.CAM_PREVIEW_SIZE
+        x, y = config.CAM_PREVIEW_POS
 
         # Neon frame
         frame_rect = pygame.Rect(x - 4, y - 4, preview_w + 8, preview_h + 8)
         pygame.draw.rect(self.screen, (255, 0, 255), frame_rect, width=3, border_radius=6)
 
         # Draw camera last
-        self.screen.blit(surf, (x, y))
+        self.screen.blit(self.cam_surface, (x, y))
 
     def spawn_logic(self):
         d = config.DIFFICULTY[self.difficulty]
@@ -201,11 +255,13 @@ class FruitNinjaGame:
                             else:
                                 self.combo_count = 1
                             self.last_slice_time = now_ms
+                            self.telemetry.record_slice(self.combo_count)
 
             # remove off-screen fruits
             if fruit.is_off_screen():
                 if not fruit.is_sliced and not fruit.is_bomb:
                     self.lives -= 1
+                    self.telemetry.record_miss()
                     if self.lives <= 0:
                         self.state = "game_over"
                 try:
@@ -269,7 +325,8 @@ class FruitNinjaGame:
             self.screen.blit(combo_txt, (config.SCREEN_WIDTH // 2 - combo_txt.get_width() // 2, 40))
 
         # --- CAMERA ALWAYS LAST (IMPORTANT FIX!!) ---
-        self.handle_camera()
+        # (the frame itself is read once per loop in run(), not here)
+        self.draw_camera_preview()
 
     def draw_background(self):
         # simple vertical gradient
@@ -302,9 +359,10 @@ class FruitNinjaGame:
 
     def slow_motion(self, frames=120):
         # simple slow motion effect: reduce spawn rate and gravity temporarily
-        prev = config.DIFFICULTY[self.difficulty].copy()
-        config.DIFFICULTY[self.difficulty]['spawn_rate'] *= 2
-        config.DIFFICULTY[self.difficulty]['gravity'] *= 0.6
+        # derived from the base preset so a second freeze doesn't compound the first
+        prev = self._base_difficulty[self.difficulty].copy()
+        config.DIFFICULTY[self.difficulty]['spawn_rate'] = prev['spawn_rate'] * 2
+        config.DIFFICULTY[self.difficulty]['gravity'] = prev['gravity'] * 0.6
         # schedule revert after frames
         revert_frame = self.frame_count + frames
 
@@ -334,6 +392,20 @@ class FruitNinjaGame:
         diff = self.font_medium.render(f"Difficulty: {self.difficulty}", True, config.NEON)
         self.screen.blit(diff, (config.SCREEN_WIDTH // 2 - diff.get_width() // 2, 340))
 
+        # camera / hand model loading progress
+        if self.loader is not None and (not self.loader.done or self.loader.error):
+            bar_w, bar_h = 420, 16
+            bx = config.SCREEN_WIDTH // 2 - bar_w // 2
+            by = 440
+            pygame.draw.rect(self.screen, config.WHITE, (bx, by, bar_w, bar_h), width=2, border_radius=6)
+            fill_color = config.RED if self.loader.error else config.NEON
+            pygame.draw.rect(self.screen, fill_color, (bx + 3, by + 3, int((bar_w - 6) * self.loader.progress), bar_h - 6),
+                             border_radius=4)
+            st = self.font_small.render(self.loader.status, True, config.WHITE)
+            self.screen.blit(st, (config.SCREEN_WIDTH // 2 - st.get_width() // 2, by + 28))
+
+        self.draw_camera_preview()
+
     def draw_game_over(self):
         self.screen.fill((60, 0, 0))
         g = self.font_large.render("GAME OVER", True, config.WHITE)
@@ -345,7 +417,22 @@ class FruitNinjaGame:
         r = self.font_small.render("Press R to Restart or Q to Quit", True, config.WHITE)
         self.screen.blit(r, (config.SCREEN_WIDTH // 2 - r.get_width() // 2, 420))
 
+    def end_session(self):
+        # hand the finished session to the store; no disk I/O on this thread
+        if self.telemetry is None:
+            return
+        self.store.record_session(self.telemetry, self.score)
+        self.store.submit_high_score(self.difficulty, self.score)
+        self.telemetry = None
+
     def reset_game(self):
+        self.end_session()
+        # drop any slow motion still active from the previous game
+        for name, d in self._base_difficulty.items():
+            config.DIFFICULTY[name] = d.copy()
+        if hasattr(self, "_slow_motion_revert"):
+            del self._slow_motion_revert
+        self.telemetry = SessionTelemetry(self.difficulty)
         self.score = 0
         self.lives = config.INITIAL_LIVES
         self.fruits = []
@@ -361,16 +448,20 @@ class FruitNinjaGame:
         idx = keys.index(self.difficulty)
         idx = (idx + 1) % len(keys)
         self.difficulty = keys[idx]
+        self.high_score = self.store.get_high_score(self.difficulty)
 
     def run(self):
         running = True
         while running:
             dt = self.clock.tick(config.FPS)
+            # frame work time, excluding the tick() sleep (same as soak.py)
+            frame_start = time.perf_counter()
+            played = self.state == "playing"
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
                 if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_SPACE and self.state == "menu":
+                    if event.key == pygame.K_SPACE and self.state == "menu" and (self.loader is None or self.loader.done):
                         self.reset_game()
                     elif event.key == pygame.K_r and self.state == "game_over":
                         self.reset_game()
@@ -384,6 +475,8 @@ class FruitNinjaGame:
                         self.toggle_difficulty()
 
             # camera & input
+            self.poll_loader()
+            self.poll_store()
             self.handle_camera()
 
             # game update/draw
@@ -402,12 +495,44 @@ class FruitNinjaGame:
 
             pygame.display.flip()
 
+            if played:
+                self.telemetry.record_frame((time.perf_counter() - frame_start) * 1000.0)
+                if self.state == "game_over":
+                    self.end_session()
+
+            if "first_frame" not in self.startup_times:
+                self.startup_times["first_frame"] = time.time()
+            if self.startup_bench and self.startup_bench_finished():
+                self.report_startup()
+                running = False
+
         # cleanup
-        self.cap.release()
+        self.end_session()
+        self.store.close()
+        if self.camera is not None:
+            self.camera.release()
         pygame.quit()
         sys.exit()
 
+    def startup_bench_finished(self):
+        # stop at the first hand, on load failure, or when no hand shows up in time
+        if "first_detection" in self.startup_times or self.loader is None or self.loader.error:
+            return True
+        first_inference = self.startup_times.get("first_inference")
+        return first_inference is not None and time.time() - first_inference > self.bench_hand_timeout
+
+    def report_startup(self):
+        # one JSON line, parsed by bench_startup.py
+        report = {"ok": self.loader is not None and self.loader.error is None, "times": self.startup_times}
+        print("STARTUP_BENCH " + json.dumps(report), flush=True)
+
 
 if __name__ == "__main__":
-    game = FruitNinjaGame()
+    parser = argparse.ArgumentParser(description="AI Fruit Ninja")
+    parser.add_argument("--startup-bench", action="store_true",
+                        help="exit after the first hand detection and print startup timings")
+    parser.add_argument("--bench-hand-timeout", type=float, default=10.0,
+                        help="with --startup-bench, seconds to wait for a hand after the first inference")
+    args = parser.parse_args()
+    game = FruitNinjaGame(startup_bench=args.startup_bench, bench_hand_timeout=args.bench_hand_timeout)
     game.run()
@@ -0,0 +1,310 @@
+# score_store.py - persistent high scores and per-session telemetry (SQLite)
+import argparse
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+import config
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS high_scores (
+    difficulty TEXT PRIMARY KEY,
+    score INTEGER NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at REAL NOT NULL,
+    ended_at REAL NOT NULL,
+    difficulty TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    frames INTEGER NOT NULL,
+    frame_ms_total REAL NOT NULL,
+    frame_ms_max REAL NOT NULL,
+    frame_hist TEXT NOT NULL,
+    detections INTEGER NOT NULL,
+    detection_ms_total REAL NOT NULL,
+    detection_ms_max REAL NOT NULL,
+    slices INTEGER NOT NULL,
+    misses INTEGER NOT NULL,
+    combos INTEGER NOT NULL,
+    max_combo INTEGER NOT NULL
+);
+"""
+
+_SESSION_COLUMNS = (
+    "started_at", "ended_at", "difficulty", "score", "frames", "frame_ms_total",
+    "frame_ms_max", "frame_hist", "detections", "detection_ms_total",
+    "detection_ms_max", "slices", "misses", "combos", "max_combo"
+)
+
+_STOP = object()
+
+
+def _connect(path):
+    conn = sqlite3.connect(path)
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+class SessionTelemetry:
+    """Counters for one play session. Updated from the game loop, no I/O."""
+
+    def __init__(self, difficulty, buckets=config.FRAME_TIME_BUCKETS_MS):
+        self.difficulty = difficulty
+        self.started_at = time.time()
+        self.buckets = tuple(buckets)
+        # one extra slot for frames slower than the last bucket edge
+        self.frame_hist = [0] * (len(self.buckets) + 1)
+        self.frames = 0
+        self.frame_ms_total = 0.0
+        self.frame_ms_max = 0.0
+        self.detections = 0
+        self.detection_ms_total = 0.0
+        self.detection_ms_max = 0.0
+        self.slices = 0
+        self.misses = 0
+        self.combos = 0
+        self.max_combo = 0
+
+    def record_frame(self, frame_ms):
+        # frame_ms is update + draw work time, not including the FPS-cap sleep
+        self.frames += 1
+        self.frame_ms_total += frame_ms
+        self.frame_ms_max = max(self.frame_ms_max, frame_ms)
+        for i, edge in enumerate(self.buckets):
+            if frame_ms <= edge:
+                self.frame_hist[i] += 1
+                return
+        self.frame_hist[-1] += 1
+
+    def record_detection(self, detection_ms):
+        self.detections += 1
+        self.detection_ms_total += detection_ms
+        self.detection_ms_max = max(self.detection_ms_max, detection_ms)
+
+    def record_slice(self, combo_count):
+        self.slices += 1
+        if combo_count >= 2:
+            self.combos += 1
+        self.max_combo = max(self.max_combo, combo_count)
+
+    def record_miss(self):
+        self.misses += 1
+
+    def to_row(self, score):
+        hist = {"buckets_ms": list(self.buckets), "counts": self.frame_hist}
+        return (
+            self.started_at, time.time(), self.difficulty, score, self.frames,
+            self.frame_ms_total, self.frame_ms_max, json.dumps(hist),
+            self.detections, self.detection_ms_total, self.detection_ms_max,
+            self.slices, self.misses, self.combos, self.max_combo
+        )
+
+
+class ScoreStore:
+    """High scores and session rows, written in batches by a background thread.
+
+    High scores are read by the writer thread when it starts and merged into a
+    cache (`loaded` is set once that's done, 0 is reported until then); the
+    game loop only touches the cache and a queue, never the database file.
+    """
+
+    def __init__(self, path=config.SCORE_DB_PATH, batch_size=config.STORE_BATCH_SIZE,
+                 flush_interval=config.STORE_FLUSH_INTERVAL_S):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._high_scores = {}
+        self.loaded = threading.Event()
+
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._writer, name="score-store-writer", daemon=True)
+        self._thread.start()
+
+    def get_high_score(self, difficulty):
+        return self._high_scores.get(difficulty, 0)
+
+    def submit_high_score(self, difficulty, score):
+        if score <= self.get_high_score(difficulty):
+            return False
+        self._high_scores[difficulty] = score
+        self._queue.put(("high_score", (difficulty, score, time.time())))
+        return True
+
+    def record_session(self, telemetry, score):
+        self._queue.put(("session", telemetry.to_row(score)))
+
+    def close(self, timeout=2.0):
+        # flush whatever is pending and stop the writer
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def _writer(self):
+        try:
+            conn = _connect(self.path)
+            for difficulty, score in conn.execute("SELECT difficulty, score FROM high_scores"):
+                # keep anything submitted before the load finished
+                self._high_scores[difficulty] = max(score, self._high_scores.get(difficulty, 0))
+        except sqlite3.Error as e:
+            print("Score store open error:", e)
+            return
+        finally:
+            self.loaded.set()
+
+        stopping = False
+        while not stopping:
+            batch = []
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            # drain up to batch_size items so one transaction covers a burst
+            while True:
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+                if stopping or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._write_batch(conn, batch)
+        conn.close()
+
+    def _write_batch(self, conn, batch):
+        high_scores = [args for kind, args in batch if kind == "high_score"]
+        sessions = [args for kind, args in batch if kind == "session"]
+        placeholders = ", ".join("?" * len(_SESSION_COLUMNS))
+        try:
+            with conn:
+                if high_scores:
+                    conn.executemany(
+                        "INSERT INTO high_scores (difficulty, score, updated_at) VALUES (?, ?, ?) "
+                        "ON CONFLICT(difficulty) DO UPDATE SET score = excluded.score, "
+                        "updated_at = excluded.updated_at WHERE excluded.score > high_scores.score",
+                        high_scores
+                    )
+                if sessions:
+                    conn.executemany(
+                        f"INSERT INTO sessions ({', '.join(_SESSION_COLUMNS)}) VALUES ({placeholders})",
+                        sessions
+                    )
+        except sqlite3.Error as e:
+            print("Score store write error:", e)
+
+
+# ---------------- CLI ----------------
+
+def _merge_histograms(rows):
+    buckets, counts = None, None
+    for (hist_json,) in rows:
+        hist = json.loads(hist_json)
+        if counts is None:
+            buckets, counts = hist["buckets_ms"], list(hist["counts"])
+        elif hist["buckets_ms"] == buckets:
+            counts = [a + b for a, b in zip(counts, hist["counts"])]
+    return buckets, counts
+
+
+def _print_histogram(buckets, counts):
+    total = sum(counts) or 1
+    labels = [f"<= {b} ms" for b in buckets] + [f" > {buckets[-1]} ms"]
+    for label, count in zip(labels, counts):
+        pct = 100.0 * count / total
+        print(f"  {label:>10}  {count:>8}  {pct:5.1f}%  {'#' * int(pct / 2)}")
+
+
+def cmd_summary(conn, args):
+    where, params = "", ()
+    if args.difficulty:
+        where, params = "WHERE difficulty = ?", (args.difficulty,)
+    rows = conn.execute(
+        "SELECT difficulty, COUNT(*), AVG(score), MAX(score), SUM(frames), SUM(frame_ms_total), "
+        "MAX(frame_ms_max), SUM(detections), SUM(detection_ms_total), MAX(detection_ms_max), "
+        "SUM(slices), SUM(misses), SUM(combos), MAX(max_combo), SUM(ended_at - started_at) "
+        f"FROM sessions {where} "
+        "GROUP BY difficulty ORDER BY difficulty", params
+    ).fetchall()
+    if not rows:
+        print("No sessions recorded.")
+        return
+
+    for (difficulty, n, avg_score, best, frames, frame_total, frame_max, dets, det_total,
+         det_max, slices, misses, combos, max_combo, wall_s) in rows:
+        # frame times are work-only, so 1000 / mean_frame is headroom, not the rate played at
+        avg_fps = frames / wall_s if wall_s else 0.0
+        max_fps = 1000.0 * frames / frame_total if frame_total else 0.0
+        print(f"[{difficulty}] sessions={n} avg_score={avg_score:.1f} best={best}")
+        print(f"  frames={frames} mean_frame={frame_total / max(frames, 1):.2f} ms "
+              f"max_frame={frame_max:.1f} ms avg_fps={avg_fps:.1f} max_fps={max_fps:.1f}")
+        print(f"  detections={dets} mean_detect={det_total / max(dets, 1):.2f} ms max_detect={det_max:.1f} ms")
+        hit_rate = 100.0 * slices / max(slices + misses, 1)
+        print(f"  slices={slices} misses={misses} hit_rate={hit_rate:.1f}% combos={combos} max_combo={max_combo}")
+        buckets, counts = _merge_histograms(
+            conn.execute("SELECT frame_hist FROM sessions WHERE difficulty = ?", (difficulty,))
+        )
+        if counts:
+            _print_histogram(buckets, counts)
+
+
+def cmd_sessions(conn, args):
+    rows = conn.execute(
+        "SELECT id, started_at, difficulty, score, frames, frame_ms_total, detections, "
+        "detection_ms_total, slices, misses, max_combo FROM sessions ORDER BY id DESC LIMIT ?",
+        (args.limit,)
+    ).fetchall()
+    print(f"{'id':>5} {'started':<19} {'difficulty':<8} {'score':>6} {'frame ms':>9} "
+          f"{'detect ms':>9} {'slices':>6} {'misses':>6} {'combo':>5}")
+    for (sid, started, difficulty, score, frames, frame_total, dets, det_total,
+         slices, misses, max_combo) in rows:
+        started_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(started))
+        print(f"{sid:>5} {started_str:<19} {difficulty:<8} {score:>6} {frame_total / max(frames, 1):>9.2f} "
+              f"{det_total / max(dets, 1):>9.2f} {slices:>6} {misses:>6} {max_combo:>5}")
+
+
+def cmd_highscores(conn, args):
+    rows = conn.execute("SELECT difficulty, score, updated_at FROM high_scores ORDER BY difficulty").fetchall()
+    if not rows:
+        print("No high scores recorded.")
+    for difficulty, score, updated in rows:
+        print(f"{difficulty:<8} {score:>6}  ({time.strftime('%Y-%m-%d %H:%M', time.localtime(updated))})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the fruit ninja score and telemetry store")
+    parser.add_argument("--db", default=config.SCORE_DB_PATH, help="path to the SQLite database")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("summary", help="aggregate performance across sessions")
+    p.add_argument("--difficulty", choices=list(config.DIFFICULTY.keys()))
+    p.set_defaults(func=cmd_summary)
+
+    p = sub.add_parser("sessions", help="list recent sessions")
+    p.add_argument("--limit", type=int, default=20)
+    p.set_defaults(func=cmd_sessions)
+
+    p = sub.add_parser("highscores", help="show high score per difficulty")
+    p.set_defaults(func=cmd_highscores)
+
+    args = parser.parse_args(argv)
+    if not os.path.isfile(args.db):
+        print(f"No database at {args.db}")
+        return 1
+    conn = _connect(args.db)
+    try:
+        args.func(conn, args)
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
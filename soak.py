@@ -0,0 +1,214 @@
+# soak.py - long unattended autoplayer sessions across a process pool
+#
+# Each worker runs a headless FruitNinjaGame (SDL dummy drivers, no camera)
+# driven by AutoPlayer, restarting after every game over, and samples
+# frame time, RSS and live object counts. Results from all workers are merged
+# into one JSON report plus a printed summary.
+#
+#   python soak.py --workers 4 --hours 2 --skill mixed
+#   python soak.py --workers 2 --minutes 5 --realtime
+import argparse
+import gc
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import config
+from perf_stats import percentile
+
+SKILLS = list(config.AUTOPLAYER_SKILLS.keys())
+
+
+def current_rss_mb():
+    # psutil if installed, else /proc (Linux); None where neither is available
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 2 ** 20
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _slope_per_hour(samples, key):
+    # least-squares slope of samples[key] against elapsed time
+    points = [(s["elapsed_s"] / 3600.0, s[key]) for s in samples if s.get(key) is not None]
+    if len(points) < 2:
+        return None
+    mean_t = sum(t for t, _ in points) / len(points)
+    mean_v = sum(v for _, v in points) / len(points)
+    var = sum((t - mean_t) ** 2 for t, _ in points)
+    if var == 0:
+        return None
+    return sum((t - mean_t) * (v - mean_v) for t, v in points) / var
+
+
+def soak_worker(job):
+    # pygame / main are imported here so the dummy drivers are set first
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+    from autoplayer import AutoPlayer
+    from main import FruitNinjaGame
+
+    random.seed(job["seed"])
+    game = FruitNinjaGame(use_camera=False, store_path=os.path.join(job["out"], f"worker{job['id']}.db"))
+    game.difficulty = job["difficulty"]
+    player = AutoPlayer(game, job["skill"], seed=job["seed"])
+    game.reset_game()
+
+    start = time.perf_counter()
+    deadline = start + job["duration_s"]
+    next_sample = start
+    samples, scores = [], []
+    interval_ms = []
+    frames = 0
+
+    while True:
+        t0 = time.perf_counter()
+        if t0 >= next_sample:
+            interval_ms.sort()
+            samples.append({
+                "elapsed_s": round(t0 - start, 2),
+                "frames": frames,
+                "frame_ms_p50": percentile(interval_ms, 50) if interval_ms else None,
+                "frame_ms_p95": percentile(interval_ms, 95) if interval_ms else None,
+                "frame_ms_max": interval_ms[-1] if interval_ms else None,
+                "rss_mb": current_rss_mb(),
+                "fruits": len(game.fruits),
+                "particles": len(game.particles),
+                "trail_points": len(game.trail.points),
+                "gc_objects": len(gc.get_objects()),
+                "games": len(scores),
+            })
+            interval_ms = []
+            next_sample += job["sample_every"]
+            if t0 >= deadline:
+                break
+
+        pygame.event.pump()
+        player.update()
+        game.update_game()
+        game.check_slow_motion_revert()
+        game.draw_game()
+        pygame.display.flip()
+
+        # work time only, measured before the FPS-cap sleep (same as FruitNinjaGame.run)
+        frame_ms = (time.perf_counter() - t0) * 1000.0
+        game.telemetry.record_frame(frame_ms)
+        interval_ms.append(frame_ms)
+        frames += 1
+
+        if game.state == "game_over":
+            scores.append(game.score)
+            game.reset_game()
+        if job["realtime"]:
+            game.clock.tick(config.FPS)
+
+    game.end_session()
+    game.store.close()
+    pygame.quit()
+    return {
+        "worker": job["id"], "skill": job["skill"], "difficulty": job["difficulty"],
+        "frames": frames, "games": len(scores), "scores": scores, "samples": samples,
+        "unintended_slices": player.unintended_slices,
+    }
+
+
+def summarize(result):
+    samples = result["samples"]
+    first, last = samples[1] if len(samples) > 1 else samples[0], samples[-1]
+    elapsed = max(last["elapsed_s"], 1e-6)
+    mean_score = sum(result["scores"]) / len(result["scores"]) if result["scores"] else 0.0
+    return {
+        "fps": result["frames"] / elapsed,
+        "games": result["games"],
+        "mean_score": mean_score,
+        "frame_p95_first": first["frame_ms_p95"],
+        "frame_p95_last": last["frame_ms_p95"],
+        "rss_first": first["rss_mb"],
+        "rss_last": last["rss_mb"],
+        "rss_mb_per_hour": _slope_per_hour(samples[1:], "rss_mb"),
+        "gc_objects_per_hour": _slope_per_hour(samples[1:], "gc_objects"),
+        "max_fruits": max(s["fruits"] for s in samples),
+        "max_particles": max(s["particles"] for s in samples),
+        "max_trail_points": max(s["trail_points"] for s in samples),
+    }
+
+
+def _fmt(value, spec):
+    return "n/a" if value is None else format(value, spec)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Multi-process autoplayer soak test")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    duration = parser.add_mutually_exclusive_group()
+    duration.add_argument("--hours", type=float)
+    duration.add_argument("--minutes", type=float)
+    parser.add_argument("--skill", default="mixed", choices=SKILLS + ["mixed"],
+                        help='"mixed" cycles through the presets per worker')
+    parser.add_argument("--difficulty", default="Normal", choices=list(config.DIFFICULTY.keys()))
+    parser.add_argument("--sample-every", type=float, default=10.0, help="seconds between samples")
+    parser.add_argument("--realtime", action="store_true", help="cap each session at config.FPS")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="soak_out", help="directory for the report and per-worker databases")
+    args = parser.parse_args(argv)
+
+    if args.hours is not None:
+        duration_s = args.hours * 3600.0
+    elif args.minutes is not None:
+        duration_s = args.minutes * 60.0
+    else:
+        duration_s = 3600.0
+    os.makedirs(args.out, exist_ok=True)
+
+    jobs = [{
+        "id": i,
+        "skill": SKILLS[i % len(SKILLS)] if args.skill == "mixed" else args.skill,
+        "difficulty": args.difficulty,
+        "duration_s": duration_s,
+        "sample_every": args.sample_every,
+        "realtime": args.realtime,
+        "seed": args.seed + i,
+        "out": args.out,
+    } for i in range(args.workers)]
+
+    started = time.time()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        results = list(pool.map(soak_worker, jobs))
+
+    unintended = sum(r["unintended_slices"] for r in results)
+    report = {"started": started, "duration_s": duration_s, "args": vars(args), "workers": []}
+    print(f"{'worker':>6} {'skill':<8} {'fps':>7} {'games':>6} {'score':>7} {'p95 ms':>13} "
+          f"{'rss MB':>15} {'MB/h':>7} {'objs/h':>9} {'fruit':>5} {'part':>5} {'trail':>5}")
+    for result in results:
+        summary = summarize(result)
+        result["summary"] = summary
+        report["workers"].append(result)
+        p95 = f"{_fmt(summary['frame_p95_first'], '.1f')}->{_fmt(summary['frame_p95_last'], '.1f')}"
+        rss = f"{_fmt(summary['rss_first'], '.0f')}->{_fmt(summary['rss_last'], '.0f')}"
+        print(f"{result['worker']:>6} {result['skill']:<8} {summary['fps']:>7.1f} {summary['games']:>6} "
+              f"{summary['mean_score']:>7.0f} {p95:>13} {rss:>15} {_fmt(summary['rss_mb_per_hour'], '.1f'):>7} "
+              f"{_fmt(summary['gc_objects_per_hour'], '.0f'):>9} {summary['max_fruits']:>5} "
+              f"{summary['max_particles']:>5} {summary['max_trail_points']:>5}")
+
+    path = os.path.join(args.out, "report.json")
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nReport written to {path}")
+    if unintended:
+        # the autoplayer sliced something while only repositioning; its skill numbers are off
+        print(f"FAIL: {unintended} fruits / bombs sliced by autoplayer repositioning moves")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
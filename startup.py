@@ -0,0 +1,90 @@
+# startup.py - load camera + hand model in the background so the menu shows immediately
+import threading
+import time
+
+import config
+
+
+class StartupLoader:
+    """Opens the camera, builds the HandDetector and runs one warm-up inference
+    on a background thread. The game polls `done` / `progress` / `status` each
+    frame and adopts `camera` and `detector` once loading finishes.
+
+    cv2, numpy and mediapipe (via hand_detector) are imported here, on the
+    loader thread, instead of at module load of main.py; the cv2 module is
+    handed over as `cv2`.
+    """
+
+    def __init__(self, cam_index=config.CAMERA_INDEX, detector_kwargs=None):
+        self.cam_index = cam_index
+        self.detector_kwargs = detector_kwargs or {}
+
+        self.progress = 0.0
+        self.status = "Starting..."
+        self.error = None
+        self.cv2 = None
+        self.camera = None
+        self.detector = None
+
+        # absolute time.time() per stage, used by the startup benchmark
+        self.timings = {}
+
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="startup-loader", daemon=True)
+
+    def start(self):
+        self.timings["loader_start"] = time.time()
+        self._thread.start()
+        return self
+
+    @property
+    def done(self):
+        return self._done.is_set()
+
+    @property
+    def ready(self):
+        return self.done and self.error is None
+
+    def wait(self, timeout=None):
+        return self._done.wait(timeout)
+
+    def _stage(self, key, status, progress):
+        self.timings[key] = time.time()
+        self.status = status
+        self.progress = progress
+
+    def _run(self):
+        try:
+            self._stage("import_cv2", "Loading OpenCV...", 0.05)
+            import cv2
+            import numpy as np
+            from capture import FrameSource, open_camera
+
+            self._stage("open_camera", "Opening camera...", 0.2)
+            camera = FrameSource(open_camera(self.cam_index))
+            ok, frame, _ = camera.read()
+            if not ok:
+                camera.release()
+                raise RuntimeError("camera opened but returned no frames")
+
+            self._stage("load_model", "Loading hand model...", 0.45)
+            from hand_detector import HandDetector
+            detector = HandDetector(**self.detector_kwargs)
+
+            # first inference pays for graph / delegate initialisation; do it
+            # here on a blank frame rather than on the first live frame
+            self._stage("warm_up", "Warming up hand tracking...", 0.8)
+            detector.find_hands(np.zeros_like(frame), draw=False)
+
+            self.camera = camera
+            self.detector = detector
+            self.cv2 = cv2
+            cam_w, cam_h = camera.size
+            self._stage("ready", f"Ready ({cam_w}x{cam_h})", 1.0)
+        except Exception as e:
+            print("Startup load error:", e)
+            self.error = str(e)
+            self.status = "Camera / hand tracking unavailable"
+            self.progress = 1.0
+        finally:
+            self._done.set()